@@ -5,7 +5,7 @@ from schema_enforcer.schemas.validator import JmesPathModelValidation
 class CheckInterface(JmesPathModelValidation):  # pylint: disable=too-few-public-methods
     """Check that each device has more than one core uplink."""
 
-    top_level_properties = ["interfaces"]
+    top_level_properties = frozenset({"interfaces"})
     id = "CheckInterface"  # pylint: disable=invalid-name
     left = "interfaces.*[@.type=='core'][] | length([?@])"
     right = 2
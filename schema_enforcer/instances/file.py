@@ -3,7 +3,6 @@ import os
 import re
 import itertools
 from pathlib import Path
-from ruamel.yaml.comments import CommentedMap
 from schema_enforcer.utils import find_files, load_file
 
 SCHEMA_TAG = "jsonschema"
@@ -80,6 +79,7 @@ class InstanceFile:
 
         # Internal vars for caching data
         self._top_level_properties = set()
+        self._content = None
 
         if matches:
             self.matches = matches
@@ -101,7 +101,7 @@ class InstanceFile:
             if not content:
                 return self._top_level_properties
 
-            if isinstance(content, CommentedMap) or hasattr(content, "keys"):
+            if hasattr(content, "keys"):
                 self._top_level_properties = set(content.keys())
             elif isinstance(content, str):
                 self._top_level_properties = set([content])
@@ -121,17 +121,19 @@ class InstanceFile:
     def _add_matches_by_decorator(self, content=None):
         """Add matches which declare schema IDs they should adhere to using a decorator comment.
 
-        If a line of the form # jsonschema: <schema_id>,<schema_id> is defined in the data file, the
+        If a line of the form # jsonschema: <schema_id>,<schema_id> is defined at the top of the data file, the
         schema IDs will be added to the list of schema IDs the data will be checked for adherence to.
 
         Args:
-            content (string, optional): Content of the file to analyze. Default to None.
+            content (string, optional): Content of the file to analyze. Default to None, in which case only the
+                first line of the file is read, as it is the only line the decorator is matched on.
 
         Returns:
             set(string): Set of matches (strings of schema_ids) found in the file.
         """
         if not content:
-            content = self._get_content(structured=False)
+            with open(os.path.join(self.full_path, self.filename), encoding="utf-8") as fhd:
+                content = fhd.readline()
 
         matches = set()
 
@@ -150,6 +152,8 @@ class InstanceFile:
             structured (bool): Return structured data if true. If false returns the string representation of the data
             stored in the instance file. Defaults to True.
 
+        Structured content is parsed on first use and reused afterwards.
+
         Returns:
             dict, list, or str: File Contents. Dict or list if structured is set to True. Otherwise returns a string.
         """
@@ -158,7 +162,10 @@ class InstanceFile:
         if not structured:
             return Path(file_location).read_text(encoding="utf-8")
 
-        return load_file(file_location)
+        if self._content is None:
+            self._content = load_file(file_location)
+
+        return self._content
 
     def add_matches_by_property_automap(self, schema_manager):
         """Adds schema_ids to self.matches by automapping top level schema properties to top level keys in instance data.
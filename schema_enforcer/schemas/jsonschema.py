@@ -2,13 +2,27 @@
 import copy
 import json
 import os
-from functools import cached_property
+from functools import cached_property, lru_cache
 
 from jsonschema import Draft7Validator  # pylint: disable=import-self
 from schema_enforcer.schemas.validator import BaseValidation
 from schema_enforcer.validation import ValidationResult, RESULT_FAIL, RESULT_PASS
 
 
+@lru_cache(maxsize=None)
+def _load_v7_schema():
+    """Load the Draft7 meta-schema bundled with schema-enforcer, only read from disk once."""
+    local_dirname = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(local_dirname, "draft7_schema.json"), encoding="utf-8") as fhd:
+        return json.loads(fhd.read())
+
+
+@lru_cache(maxsize=None)
+def _get_v7_validator(format_checker):
+    """Return a validator for the Draft7 meta-schema, shared by all schemas using the same format checker."""
+    return Draft7Validator(_load_v7_schema(), format_checker=format_checker)
+
+
 class JsonSchema(BaseValidation):  # pylint: disable=too-many-instance-attributes
     """class to manage jsonschema type schemas."""
 
@@ -35,11 +49,7 @@ class JsonSchema(BaseValidation):  # pylint: disable=too-many-instance-attribute
     @cached_property
     def v7_schema(self):
         """Draft7 Schema."""
-        local_dirname = os.path.dirname(os.path.abspath(__file__))
-        with open(os.path.join(local_dirname, "draft7_schema.json"), encoding="utf-8") as fhd:
-            v7_schema = json.loads(fhd.read())
-
-        return v7_schema
+        return _load_v7_schema()
 
     def get_id(self):
         """Return the unique ID of the schema."""
@@ -138,7 +148,7 @@ class JsonSchema(BaseValidation):  # pylint: disable=too-many-instance-attribute
         Returns:
             List[ValidationResult]: A list of validation result objects.
         """
-        validator = Draft7Validator(self.v7_schema, format_checker=self.format_checker)
+        validator = _get_v7_validator(self.format_checker)
 
         results = []
         has_error = False
@@ -30,6 +30,8 @@ class SchemaManager:
         """
         self.schemas = {}
         self.config = config
+        # Documents loaded while resolving $ref, keyed by URI, shared by all the schemas of this manager
+        self._ref_documents = {}
 
         full_schema_dir = f"{config.main_directory}/{config.schema_directory}/"
 
@@ -51,6 +53,20 @@ class SchemaManager:
         validators = load_validators(config.validator_directory, config.pydantic_validators)
         self.schemas.update(validators)
 
+    def _load_ref_document(self, uri):
+        """Load a document referenced by a schema, reading each file only once per SchemaManager.
+
+        Args:
+            uri (string): URI of the referenced document.
+
+        Returns:
+            dict or list: content of the referenced document.
+        """
+        if uri not in self._ref_documents:
+            self._ref_documents[uri] = load_file(uri)
+
+        return self._ref_documents[uri]
+
     def create_schema_from_file(self, root, filename):
         """Create a new JsonSchema object for a given file.
 
@@ -68,7 +84,9 @@ class SchemaManager:
         # TODO Find the type of Schema based on the Type, currently only jsonschema is supported
         # schema_type = "jsonschema"
         base_uri = f"file:{root}/"
-        schema_full = jsonref.JsonRef.replace_refs(file_data, base_uri=base_uri, jsonschema=True, loader=load_file)
+        schema_full = jsonref.JsonRef.replace_refs(
+            file_data, base_uri=base_uri, jsonschema=True, loader=self._load_ref_document
+        )
         schema = JsonSchema(schema=schema_full, filename=filename, root=root)
         # Only add valid jsonschema files and raise an exception if an invalid file is found
         valid = all((result.passed() for result in schema.check_if_valid()))
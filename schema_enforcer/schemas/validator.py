@@ -4,6 +4,7 @@
 # See PEP585 (https://www.python.org/dev/peps/pep-0585/)
 from __future__ import annotations
 from typing import List, Union
+from functools import lru_cache
 import pkgutil
 import importlib
 import inspect
@@ -12,6 +13,12 @@ from pydantic import BaseModel, ValidationError
 from schema_enforcer.validation import ValidationResult
 
 
+@lru_cache(maxsize=256)
+def _compile_jmespath(expression: str):
+    """Compile a jmespath expression, each distinct expression is only parsed once."""
+    return jmespath.compile(expression)
+
+
 class BaseValidation:
     """Base class for Validation classes."""
 
@@ -75,7 +82,11 @@ class JmesPathModelValidation(BaseValidation):
             "lte": lambda r, v: int(r) <= int(v),
             "contains": lambda r, v: v in r,
         }
-        lhs = jmespath.search(self.left, data)
+        # left may be a jmespath expression string or an already compiled expression
+        left = self.left
+        if not isinstance(left, jmespath.parser.ParsedResult):
+            left = _compile_jmespath(left)
+        lhs = left.search(data)
         valid = True
         if lhs:
             # Check rhs for compiled jmespath expression
@@ -114,23 +125,29 @@ class PydanticValidation(BaseValidation):
 
 def is_validator(obj) -> bool:
     """Returns True if the object is a BaseValidation or JmesPathModelValidation subclass."""
-    try:
-        return (issubclass(obj, BaseValidation) or issubclass(obj, BaseModel)) and obj not in (
-            BaseModel,
-            BaseValidation,
-            JmesPathModelValidation,
-        )
-    except TypeError:
+    # Most module members are functions, modules or instances, reject them without raising TypeError
+    if not isinstance(obj, type):
         return False
+    return issubclass(obj, (BaseValidation, BaseModel)) and obj not in (
+        BaseModel,
+        BaseValidation,
+        JmesPathModelValidation,
+    )
 
 
 def pydantic_validation_factory(orig_model) -> PydanticValidation:
     """Create a PydanticValidation instance from a Pydantic model."""
+    return _pydantic_validation_class(orig_model, orig_model.id)
+
+
+@lru_cache(maxsize=256)
+def _pydantic_validation_class(orig_model, model_id: str) -> PydanticValidation:
+    """Build the PydanticValidation class of a model, reused every time the same model is loaded with the same ID."""
     return type(
         orig_model.__name__,
         (PydanticValidation,),
         {
-            "id": f"{orig_model.id}",
+            "id": f"{model_id}",
             "top_level_properties": set([property for property in orig_model.model_fields]),
             "model": orig_model,
         },
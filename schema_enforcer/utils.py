@@ -2,24 +2,48 @@
 import os
 import json
 import glob
+import functools
 from collections.abc import Mapping, Sequence
-import importlib
-
-from ruamel.yaml import YAML
-from ruamel.yaml.scalarstring import DoubleQuotedScalarString as DQ
-from jsonschema import (  # pylint: disable=no-name-in-module
-    RefResolver,
-    Draft7Validator,
-)
+import importlib.machinery
 
 from termcolor import colored
 
 
 from click import Option, UsageError
 
-YAML_HANDLER = YAML()
-YAML_HANDLER.indent(sequence=4, offset=2)
-YAML_HANDLER.explicit_start = True
+# ruamel.yaml and jsonschema are slow to import, so they are only imported when first needed.
+# YAML_HANDLER remains available as a module attribute and is created on first access (see __getattr__).
+_YAML_HANDLER = None
+
+
+def get_yaml_handler():
+    """Return the ruamel YAML handler shared by the loading and dumping helpers, creating it on first use.
+
+    Returns:
+        ruamel.yaml.YAML: The YAML handler.
+    """
+    global _YAML_HANDLER  # pylint: disable=global-statement
+    if _YAML_HANDLER is None:
+        from ruamel.yaml import YAML  # pylint: disable=import-outside-toplevel
+
+        _YAML_HANDLER = YAML()
+        _YAML_HANDLER.indent(sequence=4, offset=2)
+        _YAML_HANDLER.explicit_start = True
+
+    return _YAML_HANDLER
+
+
+def __getattr__(name):
+    """Resolve the lazily imported module attributes ``YAML_HANDLER`` and ``DQ``."""
+    if name == "YAML_HANDLER":
+        return get_yaml_handler()
+    if name == "DQ":
+        from ruamel.yaml.scalarstring import (  # pylint: disable=import-outside-toplevel
+            DoubleQuotedScalarString,
+        )
+
+        return DoubleQuotedScalarString
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def warn(msg):
@@ -53,29 +77,68 @@ def get_path_and_filename(filepath):
     return os.path.split(file)
 
 
+def _is_nested_sequence(value):
+    """Return True for Sequence objects that may hold strings, excluding ``str`` and ``bytes`` themselves."""
+    return isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray))
+
+
+def _quote_strings(obj):
+    """Add double quotes to every string held in ``obj``, walking it with an explicit stack rather than recursion.
+
+    Lists and mappings are updated in place; other Sequence types are rebuilt with their original type.
+
+    Args:
+        obj (any): A string, Sequence or Mapping object.
+
+    Returns:
+        any: ``obj`` with double quotes added to its string values.
+    """
+    from ruamel.yaml.scalarstring import (  # pylint: disable=import-outside-toplevel
+        DoubleQuotedScalarString as DQ,
+    )
+
+    root = [obj]
+    stack = [(root, 0, obj)]
+    # Immutable sequences are swapped for a list while their entries are updated, then converted back
+    rebuild = []
+    # Repeated string values share one quoted string instead of allocating a new one per occurrence
+    quoted = {}
+    while stack:
+        parent, key, value = stack.pop()
+        # dict and list are tested before the Mapping and Sequence ABCs, whose isinstance checks are slower
+        if isinstance(value, str):
+            quoted_value = quoted.get(value)
+            if quoted_value is None:
+                quoted_value = quoted[value] = DQ(value)
+            parent[key] = quoted_value
+        elif isinstance(value, (dict, Mapping)):
+            stack.extend((value, child_key, child) for child_key, child in value.items())
+        elif isinstance(value, list) or _is_nested_sequence(value):
+            if not isinstance(value, list):
+                rebuild.append((parent, key, type(value)))
+                value = list(value)
+                parent[key] = value
+            stack.extend((value, index, child) for index, child in enumerate(value))
+
+    # Nested sequences are recorded after their parents, so rebuild them first
+    for parent, key, iter_type in reversed(rebuild):
+        parent[key] = iter_type(parent[key])
+
+    return root[0]
+
+
 def ensure_strings_have_quotes_sequence(sequence_object):
     """Ensures Sequence objects have quotes on string entries.
 
+    Lists are updated in place; other Sequence types are rebuilt with the same type.
+
     Args:
         sequence_object (iter): A python iterable object to ensure strings have quotes.
 
     Returns:
         iter: The ``sequence_object`` is returned having its string values with quotes.
     """
-    iter_type = type(sequence_object)
-    sequence_with_strings = []
-    for entry in sequence_object:
-        if isinstance(entry, str):
-            new_entry = DQ(entry)
-        elif isinstance(entry, Sequence):
-            new_entry = ensure_strings_have_quotes_sequence(entry)
-        elif isinstance(entry, Mapping):
-            new_entry = ensure_strings_have_quotes_mapping(entry)
-        else:
-            new_entry = entry
-
-        sequence_with_strings.append(new_entry)
-    return iter_type(sequence_with_strings)
+    return _quote_strings(sequence_object)
 
 
 def ensure_strings_have_quotes_mapping(mapping_object):
@@ -87,14 +150,7 @@ def ensure_strings_have_quotes_mapping(mapping_object):
     Returns:
         dict: The ``mapping_object`` with double quotes added to string values.
     """
-    for key, value in mapping_object.items():
-        if isinstance(value, str):
-            mapping_object[key] = DQ(value)
-        elif isinstance(value, Sequence):
-            mapping_object[key] = ensure_strings_have_quotes_sequence(value)
-        elif isinstance(value, Mapping):
-            ensure_strings_have_quotes_mapping(value)
-    return mapping_object
+    return _quote_strings(mapping_object)
 
 
 def get_conversion_filepaths(original_path, original_extension, conversion_path, conversion_extension):
@@ -128,16 +184,42 @@ def get_conversion_filepaths(original_path, original_extension, conversion_path,
     glob_files = glob.glob(glob_path, recursive=True)
     if not glob_files:
         raise FileNotFoundError(f"No {original_extension} files were found in {original_path}/**/")
-    original_paths_and_filenames = (get_path_and_filename(file) for file in glob_files)
-    original_paths, filenames = zip(*original_paths_and_filenames)
-    conversion_paths = [path.replace(original_path, conversion_path, 1) for path in original_paths]
-    conversion_files = [f"{filename}.{conversion_extension}" for filename in filenames]
-    for directory in set(conversion_paths):
+    conversion_filepaths = []
+    # Maps each original directory to its conversion directory, so relpath and normpath run once per directory
+    conversion_dirs = {}
+    for file in glob_files:
+        original_dir, filename = get_path_and_filename(file)
+        conversion_dir = conversion_dirs.get(original_dir)
+        if conversion_dir is None:
+            relative_dir = os.path.relpath(original_dir, original_path)
+            conversion_dir = os.path.normpath(os.path.join(conversion_path, relative_dir))
+            conversion_dirs[original_dir] = conversion_dir
+        conversion_filepaths.append((file, os.path.join(conversion_dir, f"{filename}.{conversion_extension}")))
+
+    # makedirs also creates the parents, so directories holding another conversion directory are skipped
+    created_dirs = set()
+    for directory in sorted(set(conversion_dirs.values()), key=len, reverse=True):
+        if directory in created_dirs:
+            continue
         os.makedirs(directory, exist_ok=True)
-    return [
-        (glob_files[seq], os.path.normpath(f"{path}/{conversion_files[seq]}"))
-        for seq, path in enumerate(conversion_paths)
-    ]
+        while directory not in created_dirs:
+            created_dirs.add(directory)
+            directory = os.path.dirname(directory)
+
+    return conversion_filepaths
+
+
+def _load_schema_json(filepath):
+    """Load a JSON schema definition file, reading it with a single read() call.
+
+    Args:
+        filepath (str): The path to a JSON schema definition file.
+
+    Returns:
+        dict: The parsed schema definition.
+    """
+    with open(filepath, "rb") as fileh:
+        return json.loads(fileh.read())
 
 
 def load_schema_from_json_file(schema_root_dir, schema_filepath):
@@ -158,9 +240,13 @@ def load_schema_from_json_file(schema_root_dir, schema_filepath):
         >>> {...}
         >>>
     """
+    from jsonschema import (  # pylint: disable=import-outside-toplevel,no-name-in-module
+        RefResolver,
+        Draft7Validator,
+    )
+
     base_uri = f"file:{schema_root_dir}/".replace("\\", "/")
-    with open(os.path.join(schema_root_dir, schema_filepath), encoding="utf-8") as fileh:
-        schema_definition = json.load(fileh)
+    schema_definition = _load_schema_json(os.path.join(schema_root_dir, schema_filepath))
 
     # Notes: The Draft7Validator will use the base_uri to resolve any relative references within the loaded schema_defnition
     # these references must match the full filenames currently, unless we modify the RefResolver to handle other cases.
@@ -193,7 +279,7 @@ def dump_data_to_yaml(data, yaml_path):
     """
     data_formatted = ensure_strings_have_quotes_mapping(data)
     with open(yaml_path, "w", encoding="utf-8") as fileh:
-        YAML_HANDLER.dump(data_formatted, fileh)
+        get_yaml_handler().dump(data_formatted, fileh)
 
 
 def dump_data_to_json(data, json_path):
@@ -243,15 +329,68 @@ def get_schema_properties(schema_files):
     """
     schema_property_map = {}
     for schema_file in schema_files:
-        with open(schema_file, encoding="utf-8") as fileh:
-            schema = json.load(fileh)
-
+        schema = _load_schema_json(schema_file)
         _, filename = get_path_and_filename(schema_file)
         schema_property_map[filename] = list(schema["properties"].keys())
 
     return schema_property_map
 
 
+# Scalar types kept by a JSON round-trip, with the function converting a subclass instance to the base type.
+# The base type methods ignore an overridden __str__ (e.g. on a str Enum), like the json encoder does.
+# bool is a subclass of int, so it is tested first.
+_BASIC_SCALAR_TYPES = ((bool, bool), (str, str.__str__), (int, int.__int__), (float, float.__float__))
+
+
+def _convert_key_to_str(key):
+    """Convert a dictionary key to the string json.dumps would write for it.
+
+    Raises:
+        TypeError: When json.dumps does not accept ``key`` as a dictionary key.
+    """
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is None or isinstance(key, (int, float)):
+        return json.dumps(key)
+
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def convert_to_basic_types(data):
+    """Recursively converts ``data`` into the basic types produced by a JSON round-trip.
+
+    dicts are copied with string keys, lists and tuples become lists, and subclasses of str, int,
+    float and bool are converted to their base type. This is equivalent to
+    ``json.loads(json.dumps(data))`` without building the intermediate string, and raises TypeError
+    for the same objects and dictionary keys the round-trip would fail on.
+
+    Args:
+        data (any): The data structure to convert.
+
+    Raises:
+        TypeError: When ``data`` contains an object which is not JSON serializable.
+
+    Returns:
+        any: A copy of ``data`` made only of dict, list, str, int, float, bool and None objects.
+
+    Example:
+        >>> from collections import OrderedDict
+        >>> convert_to_basic_types(OrderedDict([("servers", ("10.1.1.1",)), (1, True)]))
+        {'servers': ['10.1.1.1'], '1': True}
+    """
+    if data is None or type(data) in (str, int, float, bool):  # pylint: disable=unidiomatic-typecheck
+        return data
+    for base_type, to_base_type in _BASIC_SCALAR_TYPES:
+        if isinstance(data, base_type):
+            return to_base_type(data)
+    if isinstance(data, dict):
+        return {_convert_key_to_str(key): convert_to_basic_types(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [convert_to_basic_types(entry) for entry in data]
+
+    raise TypeError(f"Object of type {type(data).__name__} is not JSON serializable")
+
+
 def dump_schema_vars(output_dir, schema_properties, variables):
     """Writes variable data to file per schema in schema_properties.
 
@@ -276,21 +415,41 @@ def dump_schema_vars(output_dir, schema_properties, variables):
         >>>
     """
     os.makedirs(output_dir, exist_ok=True)
-    # Somewhat of a hack to remove non basic object types from data structure
-    variables = json.loads(json.dumps(variables))
     for schema, properties in schema_properties.items():
-        schema_data = {}
-        for prop in properties:
-            try:
-                schema_data[prop] = variables[prop]
-            except KeyError:
-                pass
+        # Remove non basic object types (e.g. AnsibleUnsafeText) from the properties written out,
+        # the rest of the host variables are never converted
+        schema_data = {prop: convert_to_basic_types(variables[prop]) for prop in properties if prop in variables}
         if schema_data:
             print(f"-> {schema}")
             yaml_file = f"{output_dir}/{schema}.yml"
             dump_data_to_yaml(schema_data, yaml_file)
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_package_schema_dir(package_name):
+    """Return the path to the ``schemas`` directory of an installed python package.
+
+    The result is cached, so each package is looked up through the import system only once per process.
+
+    Args:
+        package_name (str): The name of the python package.
+
+    Returns:
+        str: The path to ``{package}/schemas``, or None if the package could not be found.
+    """
+    try:
+        # PathFinder only searches sys.path, it doesn't import parent packages of dotted names
+        spec = importlib.machinery.PathFinder.find_spec(package_name)
+    except (ImportError, ValueError):
+        return None
+
+    # Builtin modules and namespace packages have no file on disk to locate the schemas directory from
+    if spec is None or not spec.has_location:
+        return None
+
+    return os.path.join(os.path.dirname(spec.origin), "schemas")
+
+
 def find_files(
     file_extensions, search_directories, excluded_filenames, excluded_directories=[], return_dir=False
 ):  # pylint: disable=dangerous-default-value
@@ -305,6 +464,8 @@ def find_files(
     Returns:
         list: Each element of the list will be a Tuple if return_dir is True otherwise it will be a string
     """
+    # Excluded directories are converted to absolute path once, not for every directory walked
+    abs_excluded_directories = [os.path.abspath(directory) for directory in excluded_directories]
 
     def is_part_of_excluded_dirs(current_dir):
         """Check if the current_dir is part of one of excluded_directories.
@@ -319,45 +480,37 @@ def find_files(
                 True if the current_directory is part of the list of excluded directories
                 False otherwise
         """
-        for directory in excluded_directories:
-            abs_current = os.path.abspath(current_dir)
-            abs_excluded = os.path.abspath(directory)
-            if abs_current.startswith(abs_excluded):
-                return True
-
-        return False
+        abs_current = os.path.abspath(current_dir)
+        return any(abs_current.startswith(abs_excluded) for abs_excluded in abs_excluded_directories)
 
     if not isinstance(search_directories, list):
         search_directories = list(search_directories)
 
     filenames = []
-    for search_directory in search_directories:  # pylint: disable=too-many-nested-blocks
+    for search_directory in search_directories:
         # if the search_directory is a simple name without a / we try to find it as a python package looking in the {pkg}/schemas/ dir
         if "/" not in search_directory:
-            try:
-                directory = os.path.join(
-                    os.path.dirname(importlib.machinery.PathFinder().find_module(search_directory).get_filename()),
-                    "schemas",
-                )
-            except AttributeError:
+            directory = _resolve_package_schema_dir(search_directory)
+            if directory is None:
                 error(f"Failed to find python package `{search_directory}' for loading {search_directory}/schemas/")
                 continue
 
             search_directory = directory
 
-        for root, dirs, files in os.walk(search_directory):  # pylint: disable=W0612
+        for root, dirs, files in os.walk(search_directory):
             if is_part_of_excluded_dirs(root):
+                # Everything below an excluded directory is excluded too, don't descend into it
+                dirs.clear()
                 continue
 
             for file in files:
                 # Extract the extension of the file and check if the extension matches the list
                 _, ext = os.path.splitext(file)
-                if ext in file_extensions:
-                    if file not in excluded_filenames:
-                        if return_dir:
-                            filenames.append((root, file))
-                        else:
-                            filenames.append(os.path.join(root, file))
+                if ext in file_extensions and file not in excluded_filenames:
+                    if return_dir:
+                        filenames.append((root, file))
+                    else:
+                        filenames.append(os.path.join(root, file))
 
     return filenames
 
@@ -378,11 +531,13 @@ def load_file(filename, file_type=None):
     if filename.startswith("file:///"):
         filename = filename.replace("file://", "")
 
-    handler = YAML_HANDLER if file_type == "yaml" else json
-    with open(filename, "r", encoding="utf-8") as fileh:
-        file_data = handler.load(fileh)
+    with open(filename, "rb") as fileh:
+        if file_type == "yaml":
+            # ruamel reads the whole stream in one call, and uses its name to report where a parse error is
+            return get_yaml_handler().load(fileh)
 
-    return file_data
+        # Read the whole file in one call and parse the buffer, rather than letting the parser pull small chunks
+        return json.loads(fileh.read())
 
 
 def load_data(file_extensions, search_directories, excluded_filenames, file_type=None, data_key=None):
@@ -434,15 +589,11 @@ def find_and_load_file(filename, formats=("yml", "yaml", "json")):
     Returns:
         dict, list or None: content of the file in a python variable. None if no file could be found.
     """
-    for ext in formats:
-        file_ext = f"{filename}.{ext}"
-        if not os.path.isfile(file_ext):
-            continue
-
-        data = load_file(file_ext)
-        return data
+    file_ext = find_file(filename, formats)
+    if not file_ext:
+        return None
 
-    return None
+    return load_file(file_ext)
 
 
 class MutuallyExclusiveOption(Option):
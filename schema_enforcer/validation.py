@@ -1,12 +1,22 @@
 """Validation related classes."""
+import sys
 from typing import List, Optional, Any
-from pydantic import BaseModel, ConfigDict, field_validator  # pylint: disable=no-name-in-module
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_validator  # pylint: disable=no-name-in-module
 from termcolor import colored
 
 RESULT_PASS = "PASS"  # nosec
 RESULT_FAIL = "FAIL"
 
 
+def _result_prefix(result, color):
+    """Return the colored prefix printed in front of a result.
+
+    colored() is called on every use so termcolor checks NO_COLOR, FORCE_COLOR and the tty state of stdout at
+    print time, not at import time.
+    """
+    return colored(result, color) + " |"
+
+
 class ValidationResult(BaseModel):
     """ValidationResult object.
 
@@ -30,6 +40,9 @@ class ValidationResult(BaseModel):
     absolute_path: Optional[List[str]] = []
     message: Optional[str] = None
 
+    # Copy of absolute_path and its joined string, see absolute_path_str
+    _absolute_path_cache: Optional[tuple] = PrivateAttr(default=None)
+
     # TODO: I believe we can change result to be an Enum and accomplish the same result with less code.
     @field_validator("result")
     def result_must_be_pass_or_fail(cls, var):  # pylint: disable=no-self-argument
@@ -38,28 +51,53 @@ class ValidationResult(BaseModel):
             raise ValueError("must be either PASS or FAIL")
         return var.upper()
 
+    @property
+    def absolute_path_str(self):
+        """Return absolute_path joined with ``:``.
+
+        The joined string is cached, and built again once absolute_path no longer matches the cached copy.
+
+        Returns:
+            str: The path to the property the result relates to.
+        """
+        path = self.absolute_path or []
+        cache = self._absolute_path_cache
+        if cache is None or cache[0] != path:
+            cache = self._absolute_path_cache = (list(path), ":".join(str(item) for item in path))
+        return cache[1]
+
     def passed(self):
         """Return True or False to indicate if the test has passed.
 
         Returns
             Bool: indicate if the test passed or failed
         """
-        if self.result == RESULT_PASS:
-            return True
-
-        return False
+        return self.result == RESULT_PASS
 
     def print(self):
         """Print the result of the test in CLI."""
+        msg = self.format()
+        if msg is not None:
+            sys.stdout.write(msg + "\n")
+
+    def format(self):
+        """Return the message printed to CLI for this result.
+
+        Returns:
+            str: The message, or None if nothing is printed for this result.
+        """
         if self.passed():
-            self.print_passed()
-        else:
-            self.print_failed()
+            return self.format_passed()
+        return self.format_failed()
 
-    def print_failed(self):
-        """Print the result of the test to CLI when the test failed."""
+    def format_failed(self):
+        """Return the message printed to CLI when the test failed.
+
+        Returns:
+            str: The failure message.
+        """
         # Construct the message dynamically based on the instance_type
-        msg = f"{colored('FAIL', 'red')} |"
+        msg = _result_prefix(RESULT_FAIL, "red")
         if self.instance_type == "FILE":
             msg += f" [{self.instance_type}] {self.instance_location}/{self.instance_name}"
 
@@ -70,21 +108,34 @@ class ValidationResult(BaseModel):
             msg += f" [SCHEMA ID] {self.schema_id}"
 
         if self.absolute_path:
-            msg += f" [PROPERTY] {':'.join(str(item) for item in self.absolute_path)}"
+            msg += f" [PROPERTY] {self.absolute_path_str}"
 
         if self.message:
             msg += f"\n      | [ERROR] {self.message}"
 
-        # print the msg
-        print(msg)
+        return msg
 
-    def print_passed(self):
-        """Print the result of the test to CLI when the test passed."""
+    def format_passed(self):
+        """Return the message printed to CLI when the test passed.
+
+        Returns:
+            str: The success message, or None if nothing is printed for this instance_type.
+        """
+        prefix = _result_prefix(RESULT_PASS, "green")
         if self.instance_type == "FILE":
-            print(colored("PASS", "green") + f" | [{self.instance_type}] {self.instance_location}/{self.instance_name}")
+            return f"{prefix} [{self.instance_type}] {self.instance_location}/{self.instance_name}"
 
         if self.instance_type == "HOST":
-            print(
-                colored("PASS", "green")
-                + f" | [{self.instance_type}] {self.instance_hostname} [SCHEMA ID] {self.schema_id}"
-            )
+            return f"{prefix} [{self.instance_type}] {self.instance_hostname} [SCHEMA ID] {self.schema_id}"
+
+        return None
+
+    def print_failed(self):
+        """Print the result of the test to CLI when the test failed."""
+        sys.stdout.write(self.format_failed() + "\n")
+
+    def print_passed(self):
+        """Print the result of the test to CLI when the test passed."""
+        msg = self.format_passed()
+        if msg is not None:
+            sys.stdout.write(msg + "\n")
@@ -1,19 +1,29 @@
 """Tasks for use with Invoke."""
+import functools
 import os
 import sys
-from distutils.util import strtobool
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from invoke import task
 
 try:
-    import toml
+    import tomllib
 except ImportError:
-    sys.exit("Please make sure to `pip install toml` or enable the Poetry shell and run `poetry install`.")
+    # tomllib is only part of the standard library from Python 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        sys.exit("Please make sure to `pip install tomli` or enable the Poetry shell and run `poetry install`.")
 
 
 def project_ver():
     """Find version from pyproject.toml to use for docker image tagging."""
-    with open("pyproject.toml", encoding="utf-8") as config_file:
-        return toml.load(config_file)["tool"]["poetry"].get("version", "latest")
+    return TOOL_CONFIG.get("version", "latest")
+
+
+# Values accepted by is_truthy, matching the ones of the deprecated distutils.util.strtobool
+_TRUTHY = frozenset({"y", "yes", "t", "true", "on", "1"})
+_FALSY = frozenset({"n", "no", "f", "false", "off", "0"})
 
 
 def is_truthy(arg):
@@ -29,10 +39,16 @@ def is_truthy(arg):
     """
     if isinstance(arg, bool):
         return arg
-    return bool(strtobool(arg))
+    value = arg.strip().lower()
+    if value in _TRUTHY:
+        return True
+    if value in _FALSY:
+        return False
+    raise ValueError(f"invalid truth value {arg!r}")
 
 
-PYPROJECT_CONFIG = toml.load("pyproject.toml")
+with open("pyproject.toml", "rb") as pyproject_file:
+    PYPROJECT_CONFIG = tomllib.load(pyproject_file)
 TOOL_CONFIG = PYPROJECT_CONFIG["tool"]["poetry"]
 
 # Can be set to a separate Python version to be used for launching or building image
@@ -44,12 +60,36 @@ ANSIBLE_PACKAGE = os.getenv("ANSIBLE_PACKAGE", "ansible-core")
 IMAGE_NAME = os.getenv("IMAGE_NAME", TOOL_CONFIG["name"])
 # Tag for the image
 IMAGE_VER = os.getenv("IMAGE_VER", f"{TOOL_CONFIG['version']}-py{PYTHON_VER}")
+# Registry to pull previously built images from to seed the build cache, e.g. ghcr.io/networktocode
+CACHE_REGISTRY = os.getenv("CACHE_REGISTRY")
 # Gather current working directory for Docker commands
 PWD = os.getcwd()
 # Local or Docker execution provide "local" to run locally without docker execution
 INVOKE_LOCAL = is_truthy(os.getenv("INVOKE_LOCAL", False))  # pylint: disable=W1508
 
 
+# Commands run by the lint and test tasks
+BLACK_CMD = "black --check --diff ."
+FLAKE8_CMD = "flake8 ."
+PYLINT_CMD = "pylint schema_enforcer tasks.py tests/"
+YAMLLINT_CMD = "yamllint ."
+PYDOCSTYLE_CMD = "pydocstyle ."
+BANDIT_CMD = "bandit --recursive ./ --configfile .bandit.yml"
+PYTEST_CMD = "pytest -vv --ignore=tests/test_cli_ansible_not_exists.py tests/"
+PYTEST_WITHOUT_ANSIBLE_CMD = "pytest -vv tests/test_cli_ansible_not_exists.py"
+
+# Linters are independent read-only passes over the tree, the tests task runs them in parallel
+LINT_CMDS = {
+    "black": BLACK_CMD,
+    "flake8": FLAKE8_CMD,
+    "pylint": PYLINT_CMD,
+    "yamllint": YAMLLINT_CMD,
+    "pydocstyle": PYDOCSTYLE_CMD,
+    "bandit": BANDIT_CMD,
+}
+
+
+@functools.lru_cache(maxsize=4)
 def _get_image_name(with_ansible=False):
     """Gets the name of the container image to use.
 
@@ -67,27 +107,103 @@ def _get_image_name(with_ansible=False):
     return name
 
 
-def run_cmd(context, exec_cmd, with_ansible=False):
-    """Wrapper to run the invoke task commands.
+def _run_cmd_local(
+    context, exec_cmd, with_ansible=False, hide=False, warn=False, container=None, pty=True
+):  # pylint: disable=too-many-arguments,unused-argument
+    """Run an invoke task command locally, takes the same arguments as _run_cmd_docker."""
+    print(f"LOCAL - Running command {exec_cmd}")
+    return context.run(exec_cmd, pty=pty, hide=hide, warn=warn)
+
+
+def _run_cmd_docker(
+    context, exec_cmd, with_ansible=False, hide=False, warn=False, container=None, pty=True
+):  # pylint: disable=too-many-arguments
+    """Run an invoke task command in a container.
 
     Args:
         context (invoke.task): Invoke task object.
         exec_cmd (str): Command to run.
         with_ansible (bool): Whether to run the command in a container that has ansible installed
+        hide (bool): Capture the output of the command instead of printing it
+        warn (bool): Return the result instead of raising an exception when the command fails
+        container (str): ID of a running container, started by _docker_session, in which to run the command
+        pty (bool): Run the command in a pseudo-terminal, must be False when commands are run from several threads
 
     Returns:
         result (obj): Contains Invoke result from running task.
     """
     name = _get_image_name(with_ansible)
 
+    if container:
+        print(f"DOCKER - Running command: {exec_cmd} container: {name} ({container[:12]})")
+        return context.run(f"docker exec -t {container} sh -c '{exec_cmd}'", pty=pty, hide=hide, warn=warn)
+
+    print(f"DOCKER - Running command: {exec_cmd} container: {name}")
+    return context.run(f"docker run -t -v {PWD}:/local {name} sh -c '{exec_cmd}'", pty=pty, hide=hide, warn=warn)
+
+
+# INVOKE_LOCAL doesn't change once tasks.py is loaded, so the implementation of run_cmd is chosen once
+run_cmd = _run_cmd_local if INVOKE_LOCAL else _run_cmd_docker  # pylint: disable=invalid-name
+
+
+@contextmanager
+def _docker_session(context, with_ansible=False):
+    """Start a container that several commands can be run in with run_cmd, and stop it on exit.
+
+    Starting a container takes a few seconds, running a command in an existing one is much cheaper.
+
+    Args:
+        context (invoke.task): Invoke task object.
+        with_ansible (bool): Whether to start a container that has ansible installed
+
+    Yields:
+        str: ID of the container, or None when commands are run locally.
+    """
     if INVOKE_LOCAL:
-        print(f"LOCAL - Running command {exec_cmd}")
-        result = context.run(exec_cmd, pty=True)
-    else:
-        print(f"DOCKER - Running command: {exec_cmd} container: {name}")
-        result = context.run(f"docker run -it -v {PWD}:/local {name} sh -c '{exec_cmd}'", pty=True)
+        yield None
+        return
+
+    name = _get_image_name(with_ansible)
+    result = context.run(f"docker run -d --rm -v {PWD}:/local --entrypoint sleep {name} infinity", hide=True, pty=False)
+    container = result.stdout.strip()
+    try:
+        yield container
+    finally:
+        context.run(f"docker stop {container}", hide=True, warn=True)
+
 
-    return result
+def run_lint_cmds(context, lint_cmds, container=None):
+    """Run lint commands in parallel and print a summary of their results.
+
+    Each command is run in its own subprocess, so threads are enough to run them concurrently. The output of
+    each command is captured and only printed when the command fails, to avoid interleaving it. The commands
+    are run without a pty: invoke's pty runner takes over the controlling terminal and is not thread safe.
+
+    Args:
+        context (invoke.task): Invoke task object.
+        lint_cmds (dict): Commands to run, keyed by the name of the linter.
+        container (str): ID of a running container in which to run the commands
+
+    Returns:
+        bool: True if all commands succeeded.
+    """
+    with ThreadPoolExecutor(max_workers=len(lint_cmds)) as pool:
+        futures = {
+            name: pool.submit(
+                run_cmd, context, exec_cmd, with_ansible=True, hide=True, warn=True, container=container, pty=False
+            )
+            for name, exec_cmd in lint_cmds.items()
+        }
+        results = {name: future.result() for name, future in futures.items()}
+
+    for name, result in results.items():
+        if result.exited != 0:
+            print(f"{name} failed (exit code {result.exited}):\n{result.stdout}{result.stderr}")
+
+    for name, result in results.items():
+        print(f"{name}: {'passed' if result.exited == 0 else 'failed'}")
+
+    return all(result.exited == 0 for result in results.values())
 
 
 @task
@@ -104,20 +220,34 @@ def build_image(
         with_ansible (bool): Build a container with Ansible installed
     """
     name = _get_image_name(with_ansible)
-    env = {"PYTHON_VER": PYTHON_VER}
+    env = {"PYTHON_VER": PYTHON_VER, "DOCKER_BUILDKIT": "1"}
+    # Images whose layers can be reused by this build. The with_ansible stage is built on top of the base stage.
+    cache_images = [name]
 
     if with_ansible:
         env["ANSIBLE_VER"] = ANSIBLE_VER
         env["ANSIBLE_PACKAGE"] = ANSIBLE_PACKAGE
         command = f"docker build --tag {name} --target with_ansible"
         command += f" --build-arg ANSIBLE_VER={ANSIBLE_VER} --build-arg ANSIBLE_PACKAGE={ANSIBLE_PACKAGE}"
+        base_name = f"{IMAGE_NAME}:{IMAGE_VER}"
+        if base_name != name:
+            cache_images.append(base_name)
 
     else:
-        command = command = f"docker build --tag {name} --target base"
+        command = f"docker build --tag {name} --target base"
 
     command += f" --build-arg PYTHON_VER={PYTHON_VER} -f Dockerfile ."
     if not cache:
         command += " --no-cache"
+    else:
+        # Reuse layers of previously built images. Local images are used as they are, images are only pulled
+        # when CACHE_REGISTRY points at a registry that has them. Missing images are not an error.
+        for cache_image in cache_images:
+            if CACHE_REGISTRY:
+                cache_image = f"{CACHE_REGISTRY}/{cache_image}"
+                context.run(f"docker pull {cache_image}", hide=hide, env=env, warn=True)
+            command += f" --cache-from {cache_image}"
+        command += " --build-arg BUILDKIT_INLINE_CACHE=1"
     if force_rm:
         command += " --force-rm"
 
@@ -192,8 +322,7 @@ def pytest(context):
     Args:
         context (obj): Used to run specific commands
     """
-    exec_cmd = 'find tests/ -name "test_*.py" -a -not -name "test_cli_ansible_not_exists.py" | xargs pytest -vv'
-    run_cmd(context, exec_cmd, with_ansible=True)
+    run_cmd(context, PYTEST_CMD, with_ansible=True)
 
 
 @task
@@ -206,8 +335,7 @@ def pytest_without_ansible(context):
     Args:
         context (obj): Used to run specific commands
     """
-    exec_cmd = 'find tests/ -name "test_cli_ansible_not_exists.py" | xargs pytest -vv'
-    run_cmd(context, exec_cmd)
+    run_cmd(context, PYTEST_WITHOUT_ANSIBLE_CMD)
 
 
 @task
@@ -217,8 +345,7 @@ def black(context):
     Args:
         context (obj): Used to run specific commands
     """
-    exec_cmd = "black --check --diff ."
-    run_cmd(context, exec_cmd, with_ansible=True)
+    run_cmd(context, BLACK_CMD, with_ansible=True)
 
 
 @task
@@ -228,8 +355,7 @@ def flake8(context):
     Args:
         context (obj): Used to run specific commands
     """
-    exec_cmd = "flake8 ."
-    run_cmd(context, exec_cmd, with_ansible=True)
+    run_cmd(context, FLAKE8_CMD, with_ansible=True)
 
 
 @task
@@ -239,8 +365,7 @@ def pylint(context):
     Args:
         context (obj): Used to run specific commands
     """
-    exec_cmd = "pylint **/*.py"
-    run_cmd(context, exec_cmd, with_ansible=True)
+    run_cmd(context, PYLINT_CMD, with_ansible=True)
 
 
 @task
@@ -253,8 +378,7 @@ def yamllint(context):
         image_ver (str): Define image version
         local (bool): Define as `True` to execute locally
     """
-    exec_cmd = "yamllint ."
-    run_cmd(context, exec_cmd, with_ansible=True)
+    run_cmd(context, YAMLLINT_CMD, with_ansible=True)
 
 
 @task
@@ -264,8 +388,7 @@ def pydocstyle(context):
     Args:
         context (obj): Used to run specific commands
     """
-    exec_cmd = "pydocstyle ."
-    run_cmd(context, exec_cmd, with_ansible=True)
+    run_cmd(context, PYDOCSTYLE_CMD, with_ansible=True)
 
 
 @task
@@ -275,8 +398,7 @@ def bandit(context):
     Args:
         context (obj): Used to run specific commands
     """
-    exec_cmd = "bandit --recursive ./ --configfile .bandit.yml"
-    run_cmd(context, exec_cmd, with_ansible=True)
+    run_cmd(context, BANDIT_CMD, with_ansible=True)
 
 
 @task
@@ -286,13 +408,12 @@ def tests(context):
     Args:
         context (obj): Used to run specific commands
     """
-    black(context)
-    flake8(context)
-    pylint(context)
-    yamllint(context)
-    pydocstyle(context)
-    bandit(context)
-    pytest(context)
+    # Linters and pytest share a single container, commands are run in it with docker exec
+    with _docker_session(context, with_ansible=True) as container:
+        if not run_lint_cmds(context, LINT_CMDS, container=container):
+            sys.exit("Linting failed")
+        # pytest is the heaviest step, it runs once all linters have passed
+        run_cmd(context, PYTEST_CMD, with_ansible=True, container=container)
     pytest_without_ansible(context)
     print("All tests have passed!")
 
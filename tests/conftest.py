@@ -1,5 +1,4 @@
 """conftest file for pytest"""
-import glob
 import os
 from schema_enforcer.utils import load_file
 from schema_enforcer.schemas.jsonschema import JsonSchema
@@ -20,34 +19,39 @@ FORMAT_CHECK_ERROR_MESSAGE_MAPPING = {
 }
 
 
+def _find_incorrect_format_files(directory):
+    """Return the incorrect_*.yml files of a directory, keyed by filename without extension."""
+    with os.scandir(directory) as entries:
+        return {
+            entry.name[:-4]: entry.path
+            for entry in entries
+            if entry.name.startswith("incorrect_") and entry.name.endswith(".yml")
+        }
+
+
 def pytest_generate_tests(metafunc):
     """Pytest_generate_tests prehook"""
     if metafunc.function.__name__ == "test_format_checkers":
-        schema_files = glob.glob(f"{FIXTURES_DIR}/schema/schemas/incorrect_*.yml")
-        schema_instances = []
-        for schema_file in schema_files:
-            schema_instance = JsonSchema(
-                schema=load_file(schema_file),
-                filename=os.path.basename(schema_file),
+        schema_files = _find_incorrect_format_files(os.path.join(FIXTURES_DIR, "schema", "schemas"))
+        data_files = _find_incorrect_format_files(os.path.join(FIXTURES_DIR, "hostvars", "spa-madrid-rt1"))
+        # Schema and data files are paired by filename
+        names = sorted(schema_files.keys() & data_files.keys())
+
+        schema_instances = [
+            JsonSchema(
+                schema=load_file(schema_files[name]),
+                filename=f"{name}.yml",
                 root=os.path.join(FIXTURES_DIR, "schema", "schemas"),
             )
-            schema_instances.append(schema_instance)
-
-        data_files = glob.glob(f"{FIXTURES_DIR}/hostvars/spa-madrid-rt1/incorrect_*.yml")
-        data_instances = []
-        for data_file in data_files:
-            data = load_file(data_file)
-            data_instances.append(data)
+            for name in names
+        ]
+        data_instances = [load_file(data_files[name]) for name in names]
 
         metafunc.parametrize(
             "schema_instance,data_instance, expected_error_message",
             [
-                (
-                    schema_instances[i],
-                    data_instances[i],
-                    FORMAT_CHECK_ERROR_MESSAGE_MAPPING.get(os.path.basename(schema_files[i])[:-4]),
-                )
-                for i in range(0, len(schema_instances))
+                (schema_instance, data_instance, FORMAT_CHECK_ERROR_MESSAGE_MAPPING.get(name))
+                for name, schema_instance, data_instance in zip(names, schema_instances, data_instances)
             ],
-            ids=[os.path.basename(schema_files[i])[:-4] for i in range(0, len(schema_instances))],
+            ids=names,
         )
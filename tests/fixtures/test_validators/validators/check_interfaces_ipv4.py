@@ -6,9 +6,9 @@ from schema_enforcer.schemas.validator import JmesPathModelValidation
 class CheckInterfaceIPv4(JmesPathModelValidation):  # pylint: disable=too-few-public-methods
     """Test validator for JmesPathModelValidation class"""
 
-    top_level_properties = {"interfaces"}
+    top_level_properties = frozenset({"interfaces"})
     id = "CheckInterfaceIPv4"  # pylint: disable=invalid-name
-    left = "interfaces.*[@.type=='core'][] | length([?@])"
+    left = jmespath.compile("interfaces.*[@.type=='core'][] | length([?@])")
     right = jmespath.compile("interfaces.* | length([?@.type=='core'][].ipv4)")
     operator = "eq"
     error = "All core interfaces do not have IPv4 addresses"
@@ -1,12 +1,17 @@
 """Test validator for ModelValidation class"""
+from functools import lru_cache, partial
 from schema_enforcer.schemas.validator import BaseValidation
 
+_MISSING = object()
 
+
+@lru_cache(maxsize=4096)
 def ansible_hostname(hostname: str):
     """Convert hostname to ansible format"""
     return hostname.replace("-", "_")
 
 
+@lru_cache(maxsize=4096)
 def normal_hostname(hostname: str):
     """Convert ansible hostname to normal format"""
     return hostname.replace("_", "-")
@@ -20,24 +25,35 @@ class CheckPeers(BaseValidation):  # pylint: disable=too-few-public-methods
     """
 
     id = "CheckPeers"
-    top_level_properties = set()
+    top_level_properties = frozenset()
 
     def validate(self, data: dict, strict: bool):
-        for host in data:
-            for interface, int_cfg in data[host]["interfaces"].items():
-                if "peer" not in int_cfg:
-                    continue
-                peer = int_cfg["peer"]
-                if "peer_int" not in int_cfg:
-                    self.add_validation_error("Peer interface is not defined")
-                    continue
-                peer_int = int_cfg["peer_int"]
-                peer = ansible_hostname(peer)
-                if peer not in data:
-                    continue
-                peer_match = data[peer]["interfaces"][peer_int]["peer"] == normal_hostname(host)
-                peer_int_match = data[peer]["interfaces"][peer_int]["peer_int"] == interface
-                if peer_match and peer_int_match:
-                    self.add_validation_pass()
-                else:
-                    self.add_validation_error("Peer information does not match.")
+        # Index every interface by (host, interface) so peers are found with a single lookup
+        index = {
+            (host, interface): int_cfg
+            for host, host_data in data.items()
+            for interface, int_cfg in host_data["interfaces"].items()
+        }
+        # Result helpers bound once rather than looked up on every link
+        add_pass = self.add_validation_pass
+        add_undefined = partial(self.add_validation_error, "Peer interface is not defined")
+        add_mismatch = partial(self.add_validation_error, "Peer information does not match.")
+        for (host, interface), int_cfg in index.items():
+            peer = int_cfg.get("peer", _MISSING)
+            if peer is _MISSING:
+                continue
+            peer_int = int_cfg.get("peer_int", _MISSING)
+            if peer_int is _MISSING:
+                add_undefined()
+                continue
+            peer = ansible_hostname(peer)
+            if peer not in data:
+                continue
+            peer_iface = index.get((peer, peer_int))
+            # A peer pointing at an interface the peer host doesn't define is a broken reference
+            if peer_iface is None or "peer" not in peer_iface or "peer_int" not in peer_iface:
+                add_undefined()
+            elif peer_iface["peer"] == normal_hostname(host) and peer_iface["peer_int"] == interface:
+                add_pass()
+            else:
+                add_mismatch()
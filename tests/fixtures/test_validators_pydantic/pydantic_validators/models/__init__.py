@@ -1,9 +1,31 @@
-from .dns import Dns
-from .hostname import Hostname
-from .interfaces import Interfaces  # , Interface, InterfaceTypes
+"""Pydantic models and managers, loaded on first access."""
+import functools
+import importlib
 
 from schema_enforcer.schemas.manager import PydanticManager
 
+# Model name -> submodule defining it. Models are only imported when accessed, see __getattr__.
+_MODEL_MODULES = {
+    "Dns": ".dns",
+    "Hostname": ".hostname",
+    "Interfaces": ".interfaces",  # , Interface, InterfaceTypes
+}
 
-manager1 = PydanticManager(models=[Hostname, Interfaces])
-manager2 = PydanticManager(prefix="pydantic", models=[Hostname, Interfaces, Dns])
+
+@functools.lru_cache(maxsize=None)
+def get_managers():
+    """Build the PydanticManager instances the first time they are needed."""
+    dns, hostname, interfaces = (__getattr__(name) for name in ("Dns", "Hostname", "Interfaces"))
+    return {
+        "manager1": PydanticManager(models=[hostname, interfaces]),
+        "manager2": PydanticManager(prefix="pydantic", models=[hostname, interfaces, dns]),
+    }
+
+
+def __getattr__(name):
+    """Import the models and build the managers lazily."""
+    if name in _MODEL_MODULES:
+        return getattr(importlib.import_module(_MODEL_MODULES[name], __name__), name)
+    if name in ("manager1", "manager2"):
+        return get_managers()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,11 @@
 
 from typing import List
 from pydantic import BaseModel, Field
-from pydantic.networks import IPvAnyAddress
+
+from .ip_address import IPvAnyStr
 
 
 class Dns(BaseModel):
     """Validate DNS is valid."""
 
-    dns_servers: List[IPvAnyAddress] = Field(description="DNS servers")
+    dns_servers: List[IPvAnyStr] = Field(description="DNS servers")
@@ -2,9 +2,10 @@
 
 from enum import Enum
 from typing import Dict, Optional
-from ipaddress import IPv4Address, IPv6Address
 from pydantic import BaseModel
 
+from .ip_address import IPv4Str, IPv6Str
+
 
 class InterfaceTypes(str, Enum):
     """Interface types."""
@@ -14,8 +15,8 @@ class InterfaceTypes(str, Enum):
 
 
 class Interface(BaseModel):
-    ipv4: Optional[IPv4Address] = None
-    ipv6: Optional[IPv6Address] = None
+    ipv4: Optional[IPv4Str] = None
+    ipv6: Optional[IPv6Str] = None
     peer: Optional[str] = None
     peer_int: Optional[str] = None
     type: Optional[InterfaceTypes] = None
@@ -0,0 +1,62 @@
+"""IP address string types validated with socket.inet_pton."""
+
+import ipaddress
+import socket
+
+from typing_extensions import Annotated
+from pydantic import BeforeValidator
+from pydantic_core import PydanticCustomError
+
+
+def _is_valid_address(family, value):
+    """Return True if value is a valid address of the given socket address family."""
+    try:
+        socket.inet_pton(family, value)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _validate_address(value, families, address_classes, error_type, message):
+    """Return value as an address string, or raise the error pydantic's IP address types raise.
+
+    Plain strings are checked with inet_pton. Anything inet_pton does not accept, such as integers, packed bytes,
+    ipaddress objects or scoped IPv6 addresses, goes through the ipaddress classes pydantic uses.
+    """
+    if isinstance(value, str) and any(_is_valid_address(family, value) for family in families):
+        return value
+    for address_class in address_classes:
+        try:
+            return str(address_class(value))
+        except ValueError:
+            pass
+    raise PydanticCustomError(error_type, message)
+
+
+def _validate_ipv4(value):
+    return _validate_address(
+        value, (socket.AF_INET,), (ipaddress.IPv4Address,), "ip_v4_address", "Input is not a valid IPv4 address"
+    )
+
+
+def _validate_ipv6(value):
+    return _validate_address(
+        value, (socket.AF_INET6,), (ipaddress.IPv6Address,), "ip_v6_address", "Input is not a valid IPv6 address"
+    )
+
+
+def _validate_ip_any(value):
+    return _validate_address(
+        value,
+        (socket.AF_INET, socket.AF_INET6),
+        (ipaddress.IPv4Address, ipaddress.IPv6Address),
+        "ip_any_address",
+        "value is not a valid IPv4 or IPv6 address",
+    )
+
+
+# The accepted inputs, error types and messages are the ones of pydantic's IPv4Address, IPv6Address and
+# IPvAnyAddress
+IPv4Str = Annotated[str, BeforeValidator(_validate_ipv4)]
+IPv6Str = Annotated[str, BeforeValidator(_validate_ipv6)]
+IPvAnyStr = Annotated[str, BeforeValidator(_validate_ip_any)]
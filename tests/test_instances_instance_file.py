@@ -11,12 +11,16 @@ from schema_enforcer.validation import ValidationResult
 from schema_enforcer.config import Settings
 
 FIXTURES_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fixtures", "test_instances")
+HOSTVARS_DIR = os.path.join(FIXTURES_DIR, "hostvars")
+ENG_LONDON_DIR = os.path.join(HOSTVARS_DIR, "eng-london-rt1")
+CHI_BEIJING_DIR = os.path.join(HOSTVARS_DIR, "chi-beijing-rt1")
 
 CONFIG_DATA = {
     "main_directory": os.path.join(FIXTURES_DIR, "schema"),
-    "data_file_search_directories": [os.path.join(FIXTURES_DIR, "hostvars")],
+    "data_file_search_directories": [HOSTVARS_DIR],
     "schema_mapping": {"dns.yml": ["schemas/dns_servers"]},
 }
+SETTINGS = Settings(**CONFIG_DATA)
 
 
 @pytest.fixture
@@ -25,7 +29,7 @@ def if_w_extended_matches():
     InstanceFile class with extended matches defined as a `# jsonschema:` decorator in the
     instance file.
     """
-    if_instance = InstanceFile(root=os.path.join(FIXTURES_DIR, "hostvars", "eng-london-rt1"), filename="ntp.yaml")
+    if_instance = InstanceFile(root=ENG_LONDON_DIR, filename="ntp.yaml")
 
     return if_instance
 
@@ -36,7 +40,7 @@ def if_w_matches():
     InstanceFile class with matches passed in
     """
     if_instance = InstanceFile(
-        root=os.path.join(FIXTURES_DIR, "hostvars", "eng-london-rt1"),
+        root=ENG_LONDON_DIR,
         filename="dns.yaml",
         matches={"schemas/dns_servers"},
     )
@@ -50,28 +54,28 @@ def if_wo_matches():
     InstanceFile class without matches passed in and without extended matches denoted in a `# jsonschema`
     decorator in the instance file.
     """
-    if_instance = InstanceFile(root=os.path.join(FIXTURES_DIR, "hostvars", "chi-beijing-rt1"), filename="syslog.yml")
+    if_instance = InstanceFile(root=CHI_BEIJING_DIR, filename="syslog.yml")
 
     return if_instance
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def schema_manager():
     """
-    Instantiated SchemaManager class
+    Instantiated SchemaManager class, shared by the tests of this module so schemas are only loaded once
 
     Returns:
         SchemaManager
     """
-    schema_manager = SchemaManager(config=Settings(**CONFIG_DATA))
+    schema_manager = SchemaManager(config=SETTINGS)
 
     return schema_manager
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ifm():
-    """Instance of InstanceFileManager."""
-    ifm = InstanceFileManager(config=Settings(**CONFIG_DATA))
+    """Instance of InstanceFileManager, instance files are only discovered once per module."""
+    ifm = InstanceFileManager(config=SETTINGS)
     return ifm
 
 
@@ -86,21 +90,21 @@ def test_init(if_wo_matches, if_w_matches, if_w_extended_matches):
     """
     assert if_wo_matches.matches == set()
     assert not if_wo_matches.data
-    assert if_wo_matches.path == os.path.join(FIXTURES_DIR, "hostvars", "chi-beijing-rt1")
+    assert if_wo_matches.path == CHI_BEIJING_DIR
     assert if_wo_matches.filename == "syslog.yml"
 
     assert if_w_matches.matches == {
         "schemas/dns_servers",
     }
     assert not if_w_matches.data
-    assert if_w_matches.path == os.path.join(FIXTURES_DIR, "hostvars", "eng-london-rt1")
+    assert if_w_matches.path == ENG_LONDON_DIR
     assert if_w_matches.filename == "dns.yaml"
 
     assert if_w_extended_matches.matches == {
         "schemas/ntp",
     }
     assert not if_w_extended_matches.data
-    assert if_w_extended_matches.path == os.path.join(FIXTURES_DIR, "hostvars", "eng-london-rt1")
+    assert if_w_extended_matches.path == ENG_LONDON_DIR
     assert if_w_extended_matches.filename == "ntp.yaml"
 
 
@@ -114,9 +118,11 @@ def test_get_content(if_w_matches):
     content = if_w_matches._get_content()  # pylint: disable=protected-access
     assert content["dns_servers"][0]["address"] == "10.6.6.6"
     assert content["dns_servers"][1]["address"] == "10.7.7.7"
+    # The file is only parsed once
+    assert if_w_matches._get_content() is content  # pylint: disable=protected-access
 
     raw_content = if_w_matches._get_content(structured=False)  # pylint: disable=protected-access
-    with open(os.path.join(FIXTURES_DIR, "hostvars", "eng-london-rt1", "dns.yaml"), "r", encoding="utf-8") as fhd:
+    with open(os.path.join(ENG_LONDON_DIR, "dns.yaml"), "r", encoding="utf-8") as fhd:
         assert raw_content == fhd.read()
 
 
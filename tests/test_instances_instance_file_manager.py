@@ -19,10 +19,10 @@ CONFIG_DATA = {
 }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ifm():
     """
-    Instantiate an InstanceFileManager Class for use in tests.
+    Instantiate an InstanceFileManager Class shared by the tests of this module.
 
     Returns:
         InstanceFileManager: Instantiated InstanceFileManager class
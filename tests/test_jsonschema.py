@@ -8,37 +8,45 @@ from schema_enforcer.validation import RESULT_PASS, RESULT_FAIL
 from schema_enforcer.utils import load_file
 
 FIXTURES_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fixtures", "test_jsonschema")
-LOADED_SCHEMA_DATA = load_file(os.path.join(FIXTURES_DIR, "schema", "schemas", "dns.yml"))
-LOADED_INSTANCE_DATA = load_file(os.path.join(FIXTURES_DIR, "hostvars", "chi-beijing-rt1", "dns.yml"))
+SCHEMAS_DIR = os.path.join(FIXTURES_DIR, "schema", "schemas")
+HOSTVARS_DIR = os.path.join(FIXTURES_DIR, "hostvars")
+LOADED_SCHEMA_DATA = load_file(os.path.join(SCHEMAS_DIR, "dns.yml"))
+LOADED_INSTANCE_DATA = load_file(os.path.join(HOSTVARS_DIR, "chi-beijing-rt1", "dns.yml"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def schema_instance():
-    """JSONSchema schema instance."""
+    """JSONSchema schema instance, shared by the tests of this module so its validators are only built once."""
     schema_instance = JsonSchema(
         schema=LOADED_SCHEMA_DATA,
         filename="dns.yml",
-        root=os.path.join(FIXTURES_DIR, "schema", "schemas"),
+        root=SCHEMAS_DIR,
     )
     return schema_instance
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def clear_schema_instance_results(schema_instance):
+    """Reset the results of the shared schema instance before each test."""
+    schema_instance.clear_results()
+
+
+@pytest.fixture(scope="session")
 def valid_instance_data():
     """Valid instance data loaded from YAML file."""
-    return load_file(os.path.join(FIXTURES_DIR, "hostvars", "chi-beijing-rt1", "dns.yml"))
+    return LOADED_INSTANCE_DATA
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_instance_data():
     """Invalid instance data loaded from YAML file."""
-    return load_file(os.path.join(FIXTURES_DIR, "hostvars", "can-vancouver-rt1", "dns.yml"))
+    return load_file(os.path.join(HOSTVARS_DIR, "can-vancouver-rt1", "dns.yml"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def strict_invalid_instance_data():
     """Invalid instance data when strict mode is used. Loaded from YAML file."""
-    return load_file(os.path.join(FIXTURES_DIR, "hostvars", "eng-london-rt1", "dns.yml"))
+    return load_file(os.path.join(HOSTVARS_DIR, "eng-london-rt1", "dns.yml"))
 
 
 class TestJsonSchema:
@@ -52,7 +60,7 @@ class TestJsonSchema:
             schema_instance (JsonSchema): Instance of JsonSchema class
         """
         assert schema_instance.filename == "dns.yml"
-        assert schema_instance.root == os.path.join(FIXTURES_DIR, "schema", "schemas")
+        assert schema_instance.root == SCHEMAS_DIR
         assert schema_instance.data == LOADED_SCHEMA_DATA
         assert schema_instance.id == LOADED_SCHEMA_DATA.get("$id")  # pylint: disable=invalid-name
 
@@ -66,42 +74,49 @@ class TestJsonSchema:
         assert schema_instance.get_id() == "schemas/dns_servers"
 
     @staticmethod
-    def test_validate(schema_instance, valid_instance_data, invalid_instance_data, strict_invalid_instance_data):
+    @pytest.mark.parametrize(
+        "data_fixture, strict, expected_result, expected_message, expected_path",
+        [
+            ("valid_instance_data", False, RESULT_PASS, None, []),
+            (
+                "invalid_instance_data",
+                False,
+                RESULT_FAIL,
+                "True is not of type 'string'",
+                ["dns_servers", "0", "address"],
+            ),
+            ("strict_invalid_instance_data", False, RESULT_PASS, None, []),
+            (
+                "strict_invalid_instance_data",
+                True,
+                RESULT_FAIL,
+                "Additional properties are not allowed ('fun_extr_attribute' was unexpected)",
+                [],
+            ),
+        ],
+        ids=["valid", "invalid", "strict_invalid_not_strict", "strict_invalid_strict"],
+    )
+    def test_validate(
+        request, schema_instance, data_fixture, strict, expected_result, expected_message, expected_path
+    ):  # pylint: disable=too-many-arguments
         """Tests validate method of JsonSchema class
 
         Args:
+            request (FixtureRequest): Pytest request, used to load the instance data fixture
             schema_instance (JsonSchema): Instance of JsonSchema class
+            data_fixture (str): Name of the fixture providing the instance data to validate
+            strict (bool): Whether strict validation is used
+            expected_result (str): Expected result of the validation
+            expected_message (str): Expected error message, None when the validation passes
+            expected_path (list): Expected absolute path of the error
         """
-        schema_instance.validate(data=valid_instance_data)
-        validation_results = schema_instance.get_results()
-        assert len(validation_results) == 1
-        assert validation_results[0].schema_id == LOADED_SCHEMA_DATA.get("$id")
-        assert validation_results[0].result == RESULT_PASS
-        assert validation_results[0].message is None
-        schema_instance.clear_results()
-
-        schema_instance.validate(data=invalid_instance_data)
+        schema_instance.validate(data=request.getfixturevalue(data_fixture), strict=strict)
         validation_results = schema_instance.get_results()
         assert len(validation_results) == 1
         assert validation_results[0].schema_id == LOADED_SCHEMA_DATA.get("$id")
-        assert validation_results[0].result == RESULT_FAIL
-        assert validation_results[0].message == "True is not of type 'string'"
-        assert validation_results[0].absolute_path == ["dns_servers", "0", "address"]
-        schema_instance.clear_results()
-
-        schema_instance.validate(data=strict_invalid_instance_data, strict=False)
-        validation_results = schema_instance.get_results()
-        assert validation_results[0].result == RESULT_PASS
-        schema_instance.clear_results()
-
-        schema_instance.validate(data=strict_invalid_instance_data, strict=True)
-        validation_results = schema_instance.get_results()
-        assert validation_results[0].result == RESULT_FAIL
-        assert (
-            validation_results[0].message
-            == "Additional properties are not allowed ('fun_extr_attribute' was unexpected)"
-        )
-        schema_instance.clear_results()
+        assert validation_results[0].result == expected_result
+        assert validation_results[0].message == expected_message
+        assert validation_results[0].absolute_path == expected_path
 
     @staticmethod
     def test_format_checkers(schema_instance, data_instance, expected_error_message):
@@ -133,11 +148,11 @@ class TestJsonSchema:
 
     @staticmethod
     def test_check_if_valid():
-        schema_data = load_file(os.path.join(FIXTURES_DIR, "schema", "schemas", "invalid.yml"))
+        schema_data = load_file(os.path.join(SCHEMAS_DIR, "invalid.yml"))
         schema_instance = JsonSchema(
             schema=schema_data,
             filename="invalid.yml",
-            root=os.path.join(FIXTURES_DIR, "schema", "schemas"),
+            root=SCHEMAS_DIR,
         )
         results = schema_instance.check_if_valid()
         for result in results:
@@ -3,6 +3,7 @@
 
 import os
 import sys
+from collections import Counter
 from unittest import mock
 import pytest
 from click.testing import CliRunner
@@ -25,7 +26,7 @@ CONFIG = {
 }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def schema_manager_pydantic():
     """
     Instantiated SchemaManager class that imported our pydantic_validator models.
@@ -36,7 +37,7 @@ def schema_manager_pydantic():
     return SchemaManager(config=Settings(**CONFIG))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def instance_file_manager():
     """
     Instantiated SchemaManager class that imported our pydantic_validator models.
@@ -118,62 +119,18 @@ def test_pydantic_manager_validate_show_pass_cli(_load):
         result = runner.invoke(cli.validate, ["--show-pass"])
     _load.assert_called_once()
     assert result.exit_code == 0
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/az_phx_pe01/base.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/az_phx_pe01/base.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/az_phx_pe01/base.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/az_phx_pe01/base.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/az_phx_pe01/dns.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/co_den_p01/base.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/co_den_p01/base.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/co_den_p01/base.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/co_den_p01/base.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/co_den_p01/dns.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/az_phx_pe02/base.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/az_phx_pe02/base.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/az_phx_pe02/base.yml"
-        in result.output
-    )
-    assert (
-        "\x1b[32mPASS\x1b[0m | [FILE] /local/tests/fixtures/test_validators_pydantic/inventory/host_vars/az_phx_pe02/base.yml"
-        in result.output
-    )
+    host_vars_dir = "/local/tests/fixtures/test_validators_pydantic/inventory/host_vars"
+    # Count the output lines once instead of scanning the whole output for every expected line
+    lines = Counter(result.output.splitlines())
+    # base.yml files are checked against 4 schemas and dns.yml files against 1
+    for filename, count in (
+        ("az_phx_pe01/base.yml", 4),
+        ("az_phx_pe01/dns.yml", 1),
+        ("co_den_p01/base.yml", 4),
+        ("co_den_p01/dns.yml", 1),
+        ("az_phx_pe02/base.yml", 4),
+    ):
+        assert lines[f"\x1b[32mPASS\x1b[0m | [FILE] {host_vars_dir}/{filename}"] == count, filename
     assert "\x1b[32mALL SCHEMA VALIDATION CHECKS PASSED\x1b[0m" in result.output
 
 
@@ -325,3 +282,24 @@ def test_pydantic_manager_ansible_invalid_validator_package(_load):
 \x1b[31m  ERROR |\x1b[0m No schemas were loaded
 """
     assert expected == result.output, result.output
+
+
+@pytest.mark.parametrize(
+    "address, expected",
+    [
+        pytest.param("10.1.1.1", "10.1.1.1", id="ipv4-string"),
+        pytest.param("2001:db8::1", "2001:db8::1", id="ipv6-string"),
+        pytest.param(167837953, "10.1.1.1", id="ipv4-integer"),
+        pytest.param(
+            "fe80::1%eth0",
+            "fe80::1%eth0",
+            id="ipv6-scoped",
+            marks=pytest.mark.skipif(sys.version_info < (3, 9), reason="ipaddress supports scoped IPv6 from 3.9"),
+        ),
+    ],
+)
+def test_pydantic_ip_address_accepts_ipvanyaddress_inputs(address, expected):
+    """The fixture IP address types accept the same inputs as pydantic's IPvAnyAddress."""
+    from pydantic_validators.models.dns import Dns  # pylint: disable=import-outside-toplevel,import-error
+
+    assert Dns(dns_servers=[address]).dns_servers == [expected]
@@ -7,10 +7,12 @@ from schema_enforcer.config import Settings
 from schema_enforcer.exceptions import InvalidJSONSchema
 
 FIXTURE_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fixtures")
+HOSTVARS_DIR = os.path.join(FIXTURE_DIR, "hostvars")
+TEST_MANAGER_DIR = os.path.join(FIXTURE_DIR, "test_manager")
 
 CONFIG = {
     "main_directory": os.path.join(FIXTURE_DIR, "test_instances", "schema"),
-    "data_file_search_directories": [os.path.join(FIXTURE_DIR, "hostvars")],
+    "data_file_search_directories": [HOSTVARS_DIR],
     "schema_mapping": {"dns.yml": ["schemas/dns_servers"]},
 }
 
@@ -33,7 +35,7 @@ def schema_manager():
 def test_dump(capsys, schema_manager, schema_id, result_file):
     """Test validates schema dump for multiple parameters."""
 
-    test_file = os.path.join(FIXTURE_DIR, "test_manager", "dump", result_file)
+    test_file = os.path.join(TEST_MANAGER_DIR, "dump", result_file)
     with open(test_file, encoding="utf-8") as res_file:
         expected = res_file.read()
     schema_manager.dump_schema(schema_id)
@@ -44,8 +46,8 @@ def test_dump(capsys, schema_manager, schema_id, result_file):
 def test_invalid():
     """Test validates that SchemaManager reports an error when an invalid schema is loaded."""
     config = {
-        "main_directory": os.path.join(FIXTURE_DIR, "test_manager", "invalid", "schema"),
-        "data_file_search_directories": [os.path.join(FIXTURE_DIR, "hostvars")],
+        "main_directory": os.path.join(TEST_MANAGER_DIR, "invalid", "schema"),
+        "data_file_search_directories": [HOSTVARS_DIR],
         "schema_mapping": {"dns.yml": ["schemas/dns_servers"]},
     }
     with pytest.raises(InvalidJSONSchema) as e:  # pylint: disable=invalid-name
@@ -57,7 +59,7 @@ def test_invalid():
 def test_generate_invalid(capsys):
     """Test validates that generate_invalid_test_expected generates the correct data."""
     config = {
-        "main_directory": os.path.join(FIXTURE_DIR, "test_manager", "invalid_generate", "schema"),
+        "main_directory": os.path.join(TEST_MANAGER_DIR, "invalid_generate", "schema"),
     }
     schema_id = "schemas/test"
 
@@ -83,3 +85,12 @@ def test_generate_invalid(capsys):
     schema_manager.test_schemas()
     captured = capsys.readouterr()
     assert "ALL SCHEMAS ARE VALID" in captured.out
+
+
+def test_ref_documents_loaded_once(schema_manager):
+    """Test validates that a document referenced by several schemas is loaded once and shared."""
+    ref_document = os.path.join(FIXTURE_DIR, "test_instances", "schema", "definitions", "arrays", "ip.yml")
+    ref_documents = schema_manager._ref_documents  # pylint: disable=protected-access
+    uri = f"file://{ref_document}"
+    assert uri in ref_documents
+    assert schema_manager._load_ref_document(uri) is ref_documents[uri]  # pylint: disable=protected-access
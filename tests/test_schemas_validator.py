@@ -6,33 +6,30 @@ from schema_enforcer.ansible_inventory import AnsibleInventory
 import schema_enforcer.schemas.validator as v
 
 FIXTURE_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fixtures", "test_validators")
+INVENTORY_DIR = os.path.join(FIXTURE_DIR, "inventory")
+VALIDATOR_DIR = os.path.join(FIXTURE_DIR, "validators")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def inventory():
     """Fixture for Ansible inventory used in tests."""
-    inventory_dir = os.path.join(FIXTURE_DIR, "inventory")
-
-    inventory = AnsibleInventory(inventory_dir)
+    inventory = AnsibleInventory(INVENTORY_DIR)
     return inventory
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def host_vars(inventory):
     """Fixture for providing Ansible host_vars as a consolidated dict."""
-    hosts = inventory.get_hosts_containing()
-    host_vars = {}
-    for host in hosts:
-        hostname = host.get_vars()["inventory_hostname"]
-        host_vars[hostname] = inventory.get_host_vars(host)
-    return host_vars
+    return {
+        host.get_vars()["inventory_hostname"]: inventory.get_host_vars(host)
+        for host in inventory.get_hosts_containing()
+    }
 
 
 @pytest.fixture(scope="session")
 def validators():
     """Test that validator files are loaded and appended to base class validator list."""
-    validator_path = os.path.join(FIXTURE_DIR, "validators")
-    return v.load_validators(validator_path)
+    return v.load_validators(VALIDATOR_DIR)
 
 
 def test_validator_load(validators):
@@ -44,78 +41,28 @@ def test_validator_load(validators):
     assert "CheckHostname" in validators
 
 
-def test_jmespathvalidation_pass(host_vars, validators):
-    """
-    Validator: "interfaces.*[@.type=='core'][] | length([?@])" gte 2
-    Test expected to pass for az_phx_pe01 with two core interfaces:
-        interfaces:
-          GigabitEthernet0/0/0/0:
-              type: "core"
-          GigabitEthernet0/0/0/1:
-              type: "core"
-    """
-    validator = validators["CheckInterface"]
-    validator.validate(host_vars["az_phx_pe01"], False)
-    result = validator.get_results()
-    assert result[0].passed()
-    validator.clear_results()
-
-
-def test_jmespathvalidation_fail(host_vars, validators):
-    """
-    Validator: "interfaces.*[@.type=='core'][] | length([?@])" gte 2
-    Test expected to fail for az_phx_pe02 with one core interface:
-        interfaces:
-          GigabitEthernet0/0/0/0:
-              type: "core"
-          GigabitEthernet0/0/0/1:
-              type: "access"
-    """
-    validator = validators["CheckInterface"]
-    validator.validate(host_vars["az_phx_pe02"], False)
-    result = validator.get_results()
-    assert not result[0].passed()
-    validator.clear_results()
-
-
-def test_jmespathvalidation_with_compile_pass(host_vars, validators):
-    """
-    Validator: "interfaces.*[@.type=='core'][] | length([?@])" eq jmespath.compile("interfaces.* | length([?@.type=='core'][].ipv4)")
-    Test expected to pass for az_phx_pe01 where all core interfaces have IPv4 addresses:
-        GigabitEthernet0/0/0/0:
-          ipv4: "10.1.0.1"
-          ipv6: "2001:db8::"
-          peer: "az-phx-pe02"
-          peer_int: "GigabitEthernet0/0/0/0"
-          type: "core"
-        GigabitEthernet0/0/0/1:
-          ipv4: "10.1.0.37"
-          ipv6: "2001:db8::12"
-          peer: "co-den-p01"
-          peer_int: "GigabitEthernet0/0/0/2"
-          type: "core"
-    """
-    validator = validators["CheckInterfaceIPv4"]
-    validator.validate(host_vars["az_phx_pe01"], False)
-    result = validator.get_results()
-    assert result[0].passed()
-    validator.clear_results()
-
-
-def test_jmespathvalidation_with_compile_fail(host_vars, validators):
+@pytest.mark.parametrize(
+    "validator_name, host, expected",
+    [
+        # "interfaces.*[@.type=='core'][] | length([?@])" gte 2, az_phx_pe01 has two core interfaces
+        pytest.param("CheckInterface", "az_phx_pe01", True, id="jmespath-pass"),
+        # az_phx_pe02 has one core and one access interface
+        pytest.param("CheckInterface", "az_phx_pe02", False, id="jmespath-fail"),
+        # Core interface count eq jmespath.compile("interfaces.* | length([?@.type=='core'][].ipv4)"),
+        # all core interfaces of az_phx_pe01 have IPv4 addresses
+        pytest.param("CheckInterfaceIPv4", "az_phx_pe01", True, id="jmespath-compile-pass"),
+        # co_den_p01 GigabitEthernet0/0/0/3 is a core interface without an IPv4 address
+        pytest.param("CheckInterfaceIPv4", "co_den_p01", False, id="jmespath-compile-fail"),
+    ],
+)
+def test_jmespathvalidation(host_vars, validators, validator_name, host, expected):
     """
-    Validator: "interfaces.*[@.type=='core'][] | length([?@])" eq jmespath.compile("interfaces.* | length([?@.type=='core'][].ipv4)")
-    Test expected to fail for co_den_p01 where core interface is missing an IPv4 addresses:
-        GigabitEthernet0/0/0/3:
-          ipv6: "2001:db8::16"
-          peer: "ut-slc-pe01"
-          peer_int: "GigabitEthernet0/0/0/1"
-          type: "core"
+    Test JMESPath validators, with and without a compiled right-hand side, against passing and failing hosts.
     """
-    validator = validators["CheckInterfaceIPv4"]
-    validator.validate(host_vars["co_den_p01"], False)
+    validator = validators[validator_name]
+    validator.validate(host_vars[host], False)
     result = validator.get_results()
-    assert not result[0].passed()
+    assert result[0].passed() is expected
     validator.clear_results()
 
 
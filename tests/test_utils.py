@@ -1,8 +1,14 @@
 """Tests to validate functions defined in utils.py"""
+# pylint: disable=redefined-outer-name
 
 import os
 import json
-import shutil
+from collections import OrderedDict
+from enum import Enum
+from types import MappingProxyType
+
+import pytest
+from ruamel.yaml import YAMLError
 
 from schema_enforcer import utils
 
@@ -45,13 +51,21 @@ def remove_comments_from_yaml_string(yaml_string):
     Returns:
         yaml_string (str): yaml data as a string
     """
-    yaml_payload_list = yaml_string.split("\n")
-    for item in yaml_payload_list:
-        if item.startswith("#"):
-            yaml_payload_list.remove(item)
-    yaml_string = "\n".join(yaml_payload_list)
+    return "\n".join(line for line in yaml_string.split("\n") if not line.startswith("#"))
+
+
+@pytest.fixture(scope="module")
+def formatted_yaml():
+    """Expected YAML output for TEST_DATA, without comments."""
+    with open("tests/mocks/utils/formatted.yml", encoding="utf-8") as fileh:
+        return remove_comments_from_yaml_string(fileh.read())
+
 
-    return yaml_string
+@pytest.fixture(scope="module")
+def formatted_json():
+    """Expected JSON output for TEST_DATA."""
+    with open("tests/mocks/utils/formatted.json", encoding="utf-8") as fileh:
+        return fileh.read()
 
 
 def test_get_path_and_filename():
@@ -60,23 +74,74 @@ def test_get_path_and_filename():
     assert filename == "ntp"
 
 
-def test_ensure_yaml_output_format():
+def test_ensure_yaml_output_format(formatted_yaml, tmp_path):
     data_formatted = utils.ensure_strings_have_quotes_mapping(TEST_DATA)
-    yaml_path = "tests/mocks/utils/.formatted.yml"
+    yaml_path = tmp_path / ".formatted.yml"
     with open(yaml_path, "w", encoding="utf-8") as fileh:
         utils.YAML_HANDLER.dump(data_formatted, fileh)
 
     with open(yaml_path, encoding="utf-8") as fileh:
         actual = fileh.read()
 
-    with open("tests/mocks/utils/formatted.yml", encoding="utf-8") as fileh:
-        mock = fileh.read()
+    assert actual == formatted_yaml
 
-    mock = remove_comments_from_yaml_string(mock)
 
-    assert actual == mock
-    os.remove(yaml_path)
-    assert not os.path.isfile(yaml_path)
+def test_ensure_strings_have_quotes_sequence():
+    data = ["a", ("b", 1), [b"c", {"d": "e"}]]
+    quoted = utils.ensure_strings_have_quotes_sequence(data)
+    # Lists are updated in place, other sequences keep their type
+    assert quoted is data
+    assert isinstance(quoted[0], utils.DQ)
+    assert isinstance(quoted[1], tuple)
+    assert isinstance(quoted[1][0], utils.DQ)
+    assert quoted[2][0] == b"c"
+    assert isinstance(quoted[2][1]["d"], utils.DQ)
+
+
+def test_ensure_strings_have_quotes_mapping_shares_repeated_strings():
+    data = {"vrf": "mgmt", "servers": [{"vrf": "mgmt"}]}
+    quoted = utils.ensure_strings_have_quotes_mapping(data)
+    assert quoted["vrf"] == "mgmt"
+    assert quoted["vrf"] is quoted["servers"][0]["vrf"]
+
+
+def test_resolve_package_schema_dir():
+    schema_dir = utils._resolve_package_schema_dir("json")  # pylint: disable=protected-access
+    assert schema_dir == os.path.join(os.path.dirname(json.__file__), "schemas")
+    assert utils._resolve_package_schema_dir("not_an_installed_package") is None  # pylint: disable=protected-access
+    # Builtin modules have no directory to look for schemas in
+    assert utils._resolve_package_schema_dir("sys") is None  # pylint: disable=protected-access
+
+
+def test_load_file_yaml_error_names_the_file(tmp_path):
+    yaml_path = tmp_path / "broken.yml"
+    yaml_path.write_text("---\nkey: [1, 2\n", encoding="utf-8")
+    with pytest.raises(YAMLError) as exc:
+        utils.load_file(str(yaml_path))
+    assert str(yaml_path) in str(exc.value)
+
+
+def test_find_file():
+    assert utils.find_file("tests/mocks/utils/formatted") == "tests/mocks/utils/formatted.yml"
+    assert utils.find_file("tests/mocks/utils/formatted", extensions=("json",)) == "tests/mocks/utils/formatted.json"
+    assert utils.find_file("tests/mocks/utils/missing") is None
+    assert utils.find_file("tests/mocks/missing_dir/formatted") is None
+
+
+def test_find_files_skips_excluded_directories(tmp_path):
+    for directory in ("data", "data/schema", "data/schema/nested"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "file.yml").write_text("---\n", encoding="utf-8")
+    (tmp_path / "data" / "file.txt").write_text("", encoding="utf-8")
+
+    files = utils.find_files(
+        file_extensions=[".yml"],
+        search_directories=[str(tmp_path / "data")],
+        excluded_filenames=[],
+        excluded_directories=[str(tmp_path / "data" / "schema")],
+        return_dir=True,
+    )
+    assert files == [(str(tmp_path / "data"), "file.yml")]
 
 
 def test_get_conversion_filepaths():
@@ -107,36 +172,23 @@ def test_load_schema_from_json_file():
         validator.validate(json.load(fileh))
 
 
-def test_dump_data_to_yaml():
-    test_file = "tests/mocks/utils/.test_data.yml"
-    if os.path.isfile(test_file):
-        os.remove(test_file)
-
+def test_dump_data_to_yaml(formatted_yaml, tmp_path):
+    test_file = str(tmp_path / ".test_data.yml")
     assert not os.path.isfile(test_file)
     utils.dump_data_to_yaml(TEST_DATA, test_file)
     with open(test_file, encoding="utf-8") as fileh:
         actual = fileh.read()
-    with open("tests/mocks/utils/formatted.yml", encoding="utf-8") as fileh:
-        mock = fileh.read()
 
-    mock = remove_comments_from_yaml_string(mock)
+    assert actual == formatted_yaml
 
-    assert actual == mock
-    os.remove(test_file)
-    assert not os.path.isfile(test_file)
 
-
-def test_dump_data_json():
-    test_file = "tests/mocks/utils/.test_data.json"
+def test_dump_data_json(formatted_json, tmp_path):
+    test_file = str(tmp_path / ".test_data.json")
     assert not os.path.isfile(test_file)
     utils.dump_data_to_json(TEST_DATA, test_file)
     with open(test_file, encoding="utf-8") as fileh:
         actual = fileh.read()
-    with open("tests/mocks/utils/formatted.json", encoding="utf-8") as fileh:
-        mock = fileh.read()
-    assert actual == mock
-    os.remove(test_file)
-    assert not os.path.isfile(test_file)
+    assert actual == formatted_json
 
 
 def test_get_schema_properties():
@@ -149,8 +201,55 @@ def test_get_schema_properties():
     assert actual == mock
 
 
-def test_dump_schema_vars():
-    output_dir = "tests/mocks/utils/hostvar"
+def test_convert_to_basic_types():
+    class UnsafeText(str):
+        """str subclass standing in for AnsibleUnsafeText."""
+
+    data = OrderedDict(
+        [
+            ("ntp_servers", (OrderedDict([("address", UnsafeText("10.1.1.1"))]),)),
+            (1, True),
+            ("timeout", 1.5),
+            ("vrf", None),
+        ]
+    )
+    actual = utils.convert_to_basic_types(data)
+    assert actual == json.loads(json.dumps(data))
+    assert type(actual) is dict  # pylint: disable=unidiomatic-typecheck
+    assert type(actual["ntp_servers"][0]["address"]) is str  # pylint: disable=unidiomatic-typecheck
+
+    with pytest.raises(TypeError):
+        utils.convert_to_basic_types({"servers": {"10.1.1.1"}})
+
+
+def test_convert_to_basic_types_str_enum():
+    class Vrf(str, Enum):
+        """str Enum, whose str() differs from its value."""
+
+        MGMT = "mgmt"
+
+    data = {"vrf": Vrf.MGMT, Vrf.MGMT: 1}
+    actual = utils.convert_to_basic_types(data)
+    assert actual == json.loads(json.dumps(data)) == {"vrf": "mgmt", "mgmt": 1}
+    assert type(actual["vrf"]) is str  # pylint: disable=unidiomatic-typecheck
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {("10.1.1.1", "mgmt"): "server"},
+        {"servers": MappingProxyType({"address": "10.1.1.1"})},
+    ],
+)
+def test_convert_to_basic_types_raises_like_json(data):
+    with pytest.raises(TypeError):
+        json.dumps(data)
+    with pytest.raises(TypeError):
+        utils.convert_to_basic_types(data)
+
+
+def test_dump_schema_vars(tmp_path):
+    output_dir = str(tmp_path / "hostvar")
     assert not os.path.isdir(output_dir)
     schema_properties = {
         "dns": ["dns_servers"],
@@ -166,5 +265,10 @@ def test_dump_schema_vars():
 
         assert actual == mock
 
-    shutil.rmtree(output_dir)
-    assert not os.path.isdir(output_dir)
+
+def test_dump_schema_vars_skips_unused_variables(tmp_path):
+    output_dir = str(tmp_path / "hostvar")
+    # Variables which are not part of any schema are not converted, so they may hold any object type
+    host_variables = dict(ANSIBLE_HOST_VARIABLES["host1"], unused={object()})
+    utils.dump_schema_vars(output_dir, {"dns": ["dns_servers"]}, host_variables)
+    assert os.listdir(output_dir) == ["dns.yml"]
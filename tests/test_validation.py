@@ -0,0 +1,79 @@
+"""Test ValidationResult."""
+import pytest
+
+from schema_enforcer.validation import ValidationResult, RESULT_FAIL, RESULT_PASS
+
+
+def test_validation_result_normalizes_result():
+    """
+    Test that result is upper-cased and that only PASS or FAIL are accepted.
+    """
+    assert ValidationResult(result="pass", schema_id="schemas/test").result == RESULT_PASS
+    assert ValidationResult(result="fail", schema_id="schemas/test").passed() is False
+
+    with pytest.raises(ValueError):
+        ValidationResult(result="unknown", schema_id="schemas/test")
+
+
+def test_validation_result_model_dump():
+    """
+    Test that model_dump excludes unset and None fields and coerces numbers in absolute_path to strings.
+    """
+    result = ValidationResult(result=RESULT_FAIL, schema_id="schemas/test", message="error", absolute_path=["a", 0])
+    assert result.model_dump(exclude_unset=True, exclude_none=True) == {
+        "result": RESULT_FAIL,
+        "schema_id": "schemas/test",
+        "absolute_path": ["a", "0"],
+        "message": "error",
+    }
+
+    result = ValidationResult(result=RESULT_PASS, schema_id="schemas/test")
+    assert result.model_dump(exclude_unset=True, exclude_none=True) == {
+        "result": RESULT_PASS,
+        "schema_id": "schemas/test",
+    }
+    assert result.model_dump()["absolute_path"] == []
+
+
+def test_validation_result_print(capsys):
+    """
+    Test that results are written to stdout as soon as they are printed and skipped when they have no output.
+    """
+    failed = ValidationResult(
+        result=RESULT_FAIL, schema_id="schemas/test", instance_type="HOST", instance_hostname="h1"
+    )
+    passed = ValidationResult(result=RESULT_PASS, schema_id="schemas/test", instance_type="SCHEMA")
+    assert passed.format() is None
+
+    failed.print()
+    assert capsys.readouterr().out == f"{failed.format()}\n"
+    passed.print()
+    assert capsys.readouterr().out == ""
+
+
+def test_validation_result_model_dump_assigned_fields():
+    """
+    Test that fields assigned after the result is created are included when excluding unset fields.
+    """
+    result = ValidationResult(result=RESULT_PASS, schema_id="schemas/test")
+    result.instance_type = "FILE"
+    assert result.model_dump(exclude_unset=True) == {
+        "result": RESULT_PASS,
+        "schema_id": "schemas/test",
+        "instance_type": "FILE",
+    }
+
+
+def test_validation_result_absolute_path_str():
+    """
+    Test that absolute_path is joined with colons, cached, and follows later changes to absolute_path.
+    """
+    result = ValidationResult(result=RESULT_FAIL, schema_id="schemas/test", absolute_path=["interfaces", 0, "name"])
+    assert result.absolute_path_str == "interfaces:0:name"
+    assert result.absolute_path_str is result.absolute_path_str
+    assert "[PROPERTY] interfaces:0:name" in result.format()
+    result.absolute_path = ["interfaces"]
+    assert result.absolute_path_str == "interfaces"
+    result.absolute_path.append("1")
+    assert result.absolute_path_str == "interfaces:1"
+    assert ValidationResult.model_construct(result=RESULT_PASS, schema_id="schemas/test").absolute_path_str == ""
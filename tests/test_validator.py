@@ -1,4 +1,5 @@
 """Test validator functions."""
+import jmespath
 import pytest
 from schema_enforcer.schemas.validator import (
     BaseModel,
@@ -52,3 +53,47 @@ def test_pydantic_validation_factory():
     assert issubclass(validation, BaseValidation)
     assert validation.id == "TestModel"
     assert validation.top_level_properties == {"field1", "field2"}
+
+
+def test_pydantic_validation_factory_reuses_class():
+    """Test that the validator class of a pydantic model is only built once per model and ID."""
+
+    class TestModel(BaseModel):  # pylint: disable=too-few-public-methods
+        """Custom model for testing."""
+
+        hostname: str
+
+    TestModel.id = TestModel.__name__
+    validation = pydantic_validation_factory(TestModel)
+    assert validation is pydantic_validation_factory(TestModel)
+    assert validation.id == "TestModel"
+    assert validation.top_level_properties == {"hostname"}
+
+    TestModel.id = f"prefix/{TestModel.__name__}"
+    prefixed_validation = pydantic_validation_factory(TestModel)
+    assert prefixed_validation is not validation
+    assert prefixed_validation.id == "prefix/TestModel"
+
+
+@pytest.mark.parametrize("left", ["interfaces | length(@)", jmespath.compile("interfaces | length(@)")])
+def test_jmespath_validation_left_expression(left):
+    """Test that left can be either a jmespath expression string or a compiled expression."""
+
+    class CheckInterfaceCount(JmesPathModelValidation):  # pylint: disable=too-few-public-methods
+        """Custom validator for testing."""
+
+        top_level_properties = frozenset({"interfaces"})
+        id = "CheckInterfaceCount"  # pylint: disable=invalid-name
+        right = 2
+        operator = "gte"
+        error = "Less than two interfaces"
+
+    CheckInterfaceCount.left = left
+    validator = CheckInterfaceCount()
+
+    validator.validate({"interfaces": ["eth0", "eth1"]}, False)
+    assert validator.get_results()[0].passed()
+
+    validator.clear_results()
+    validator.validate({"interfaces": ["eth0"]}, False)
+    assert validator.get_results()[0].message == "Less than two interfaces"